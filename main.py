@@ -1,11 +1,21 @@
 import os
+import gzip
+import hashlib
 import logging
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify
+import threading
+from collections import OrderedDict
+from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, make_response, g
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy.orm import DeclarativeBase
+from werkzeug.security import safe_join
 import random
 from datetime import datetime, timedelta
 
+try:
+    import brotli
+except ImportError:  # Brotli is optional; gzip is always available
+    brotli = None
+
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
 
@@ -34,6 +44,202 @@ if not app.config["SQLALCHEMY_DATABASE_URI"]:
 # Initialize the app with the extension
 db.init_app(app)
 
+# Response delivery settings
+STATIC_ASSET_MAX_AGE = 31536000  # One year for fingerprinted static assets
+RENDER_CACHE_MAX_ENTRIES = 256
+COMPRESSION_MIN_SIZE = 500  # Bytes; smaller bodies aren't worth compressing
+GZIP_LEVEL = 6  # Levels suited to compressing on every request
+BROTLI_QUALITY = 5
+COMPRESSIBLE_MIMETYPES = {
+    'text/html', 'text/css', 'text/plain',
+    'application/javascript', 'text/javascript', 'application/json'
+}
+
+# Rendered pages of saved content, keyed by content ID and kept in
+# least-recently-used order. Saved content never changes, so entries are only
+# re-rendered when a static asset they link to changes or they are evicted.
+_rendered_content_cache = OrderedDict()
+_rendered_content_lock = threading.Lock()
+# Compressed static files, keyed by (filename, fingerprint, encoding)
+_compressed_static_cache = {}
+_compressed_static_lock = threading.Lock()
+_static_fingerprints = {}
+
+def static_fingerprint(filename):
+    """Return a short content hash for a static file, cached per modification time"""
+    path = safe_join(app.static_folder, filename)
+    if path is None or not os.path.isfile(path):
+        return None
+    
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    
+    cached = _static_fingerprints.get(filename)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    fingerprint = digest.hexdigest()[:12]
+    _static_fingerprints[filename] = (mtime, fingerprint)
+    return fingerprint
+
+@app.url_defaults
+def add_static_fingerprint(endpoint, values):
+    """Append a content fingerprint to static URLs so they can be cached long-term"""
+    if endpoint == 'static' and 'filename' in values and 'v' not in values:
+        fingerprint = static_fingerprint(values['filename'])
+        if fingerprint:
+            values['v'] = fingerprint
+            # Record the asset for a page that is being rendered into the cache
+            linked_assets = g.get('linked_static_assets')
+            if linked_assets is not None:
+                linked_assets[values['filename']] = fingerprint
+
+def compress_body(data, encoding):
+    """Compress response bytes with the given content encoding"""
+    if encoding == 'br':
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=GZIP_LEVEL)
+
+def get_rendered_content(content):
+    """Return the cached page for saved content, rendering it only when needed"""
+    with _rendered_content_lock:
+        cached = _rendered_content_cache.get(content.id)
+        if cached:
+            _rendered_content_cache.move_to_end(content.id)
+    
+    if cached and all(static_fingerprint(filename) == fingerprint
+                      for filename, fingerprint in cached['static_fingerprints'].items()):
+        return cached
+    
+    # Generate placeholder image URLs (same as in generate route)
+    placeholder_images = [
+        f"https://picsum.photos/400/500?random={content.id+i+1}&blur=1" for i in range(3)
+    ]
+    
+    g.linked_static_assets = {}
+    try:
+        html = render_template('results.html',
+                             concept=content.concept,
+                             midjourney_prompts=content.midjourney_prompts,
+                             etsy_titles=content.etsy_titles,
+                             etsy_tags=content.etsy_tags,
+                             etsy_description=content.etsy_description,
+                             pinterest_caption=content.pinterest_caption,
+                             placeholder_images=placeholder_images,
+                             content_id=content.id,
+                             created_at=content.created_at,
+                             is_viewing_saved=True)
+        linked_assets = g.linked_static_assets
+    finally:
+        g.pop('linked_static_assets', None)
+    
+    data = html.encode('utf-8')
+    page = {
+        'data': data,
+        'etag': hashlib.sha1(data).hexdigest(),
+        'encoded': {},  # Compressed bodies, filled in per encoding on demand
+        'static_fingerprints': linked_assets  # Fingerprints baked into the page's static URLs
+    }
+    
+    with _rendered_content_lock:
+        _rendered_content_cache[content.id] = page
+        _rendered_content_cache.move_to_end(content.id)
+        if len(_rendered_content_cache) > RENDER_CACHE_MAX_ENTRIES:
+            _rendered_content_cache.popitem(last=False)  # Least recently used
+    return page
+
+def get_page_body(page, encoding):
+    """Return a cached page's body in the given encoding, compressing it only once"""
+    if encoding is None:
+        return page['data']
+    if encoding not in page['encoded']:
+        page['encoded'][encoding] = compress_body(page['data'], encoding)
+    return page['encoded'][encoding]
+
+def get_compressed_static_body(filename, encoding, read_data):
+    """Return a compressed static file, compressing each version of it only once"""
+    fingerprint = static_fingerprint(filename)
+    key = (filename, fingerprint, encoding)
+    with _compressed_static_lock:
+        body = _compressed_static_cache.get(key)
+    if body is not None:
+        return body
+    
+    body = compress_body(read_data(), encoding)
+    with _compressed_static_lock:
+        # Drop bodies for earlier versions of the file
+        for stale_key in [k for k in _compressed_static_cache if k[0] == filename and k[1] != fingerprint]:
+            del _compressed_static_cache[stale_key]
+        _compressed_static_cache[key] = body
+    return body
+
+def choose_content_encoding():
+    """Pick the best compression supported by both the client and the server"""
+    accepted = request.accept_encodings
+    if brotli is not None and accepted['br']:
+        return 'br'
+    if accepted['gzip']:
+        return 'gzip'
+    return None
+
+@app.after_request
+def apply_delivery_headers(response):
+    """Add caching headers and compress text responses"""
+    is_static_file = request.endpoint == 'static' and response.status_code == 200
+    static_filename = (request.view_args or {}).get('filename') if is_static_file else None
+    
+    if static_filename and request.args.get('v'):
+        if request.args['v'] == static_fingerprint(static_filename):
+            response.cache_control.no_cache = None
+            response.cache_control.public = True
+            response.cache_control.max_age = STATIC_ASSET_MAX_AGE
+            response.cache_control.immutable = True
+    
+    if response.mimetype not in COMPRESSIBLE_MIMETYPES:
+        return response
+    
+    response.vary.add('Accept-Encoding')
+    encoding = choose_content_encoding()
+    if encoding is None or response.status_code not in (200, 304):
+        return response
+    
+    # A compressed body differs byte-for-byte, so only a weak ETag still holds.
+    # 304s get the same ETag as the 200 they stand in for.
+    etag, is_weak = response.get_etag()
+    if etag and not is_weak:
+        response.set_etag(etag, weak=True)
+    
+    if response.status_code != 200 or 'Content-Encoding' in response.headers:
+        return response
+    
+    if response.content_length is not None and response.content_length < COMPRESSION_MIN_SIZE:
+        return response
+    
+    # Static files are streamed by default; read them so they can be compressed
+    response.direct_passthrough = False
+    if static_filename:
+        # The streamed file is not read on a cache hit, so close it with the response
+        if hasattr(response.response, 'close'):
+            response.call_on_close(response.response.close)
+        body = get_compressed_static_body(static_filename, encoding, response.get_data)
+    else:
+        data = response.get_data()
+        if len(data) < COMPRESSION_MIN_SIZE:
+            return response
+        body = compress_body(data, encoding)
+    
+    response.set_data(body)
+    response.headers['Content-Encoding'] = encoding
+    # Byte ranges would refer to the uncompressed file
+    response.headers.pop('Accept-Ranges', None)
+    return response
+
 def generate_midjourney_prompts(concept):
     """Generate 2-3 MidJourney prompts based on the creative concept"""
     
@@ -366,30 +572,42 @@ def view_content(content_id):
         
         db.session.commit()
         
-        # Generate placeholder image URLs (same as in generate route)
-        placeholder_images = [
-            f"https://picsum.photos/400/500?random={content_id+i+1}&blur=1" for i in range(3)
-        ]
-        
-        return render_template('results.html',
-                             concept=content.concept,
-                             midjourney_prompts=content.midjourney_prompts,
-                             etsy_titles=content.etsy_titles,
-                             etsy_tags=content.etsy_tags,
-                             etsy_description=content.etsy_description,
-                             pinterest_caption=content.pinterest_caption,
-                             placeholder_images=placeholder_images,
-                             content_id=content.id,
-                             created_at=content.created_at,
-                             is_viewing_saved=True,
-                             view_count=content.view_count,
-                             copy_count=content.copy_count)
+        # The page body never changes; counters are loaded from content_stats
+        page = get_rendered_content(content)
+        encoding = choose_content_encoding()
+        response = make_response(get_page_body(page, encoding))
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        response.set_etag(page['etag'])
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
     
     except Exception as e:
         app.logger.error(f"Error viewing content {content_id}: {str(e)}")
         flash('Content not found or error occurred.', 'error')
         return redirect(url_for('history'))
 
+@app.route('/api/content/<int:content_id>/stats')
+def content_stats(content_id):
+    """API endpoint returning the live counters for a saved content page"""
+    try:
+        from models import GeneratedContent
+        
+        content = GeneratedContent.query.get(content_id)
+        if not content:
+            return jsonify({'error': 'Content not found'}), 404
+        
+        response = jsonify({
+            'view_count': content.view_count,
+            'copy_count': content.copy_count
+        })
+        response.cache_control.no_store = True
+        return response
+    
+    except Exception as e:
+        app.logger.error(f"Error fetching stats for content {content_id}: {str(e)}")
+        return jsonify({'error': 'Failed to fetch content statistics'}), 500
+
 @app.route('/analytics')
 def analytics_dashboard():
     """Display comprehensive analytics dashboard"""
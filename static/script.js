@@ -7,7 +7,11 @@ document.addEventListener('DOMContentLoaded', function() {
     // Add click event listeners to all copy buttons
     document.querySelectorAll('.copy-btn').forEach(button => {
         button.addEventListener('click', function() {
-            const textToCopy = this.getAttribute('data-copy');
+            // Long content is read from the field it is displayed in rather than duplicated
+            const copyTarget = this.getAttribute('data-copy-target');
+            const textToCopy = copyTarget
+                ? document.querySelector(copyTarget).value
+                : this.getAttribute('data-copy');
             const copyType = this.getAttribute('data-copy-type') || 'general';
             const contentId = this.getAttribute('data-content-id');
             
@@ -92,6 +96,27 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
 
+    // Load live view/copy counters for saved content pages
+    const contentStats = document.getElementById('contentStats');
+    if (contentStats) {
+        fetch(contentStats.getAttribute('data-stats-url'))
+            .then(response => response.ok ? response.json() : null)
+            .then(stats => {
+                if (!stats || stats.view_count <= 0) {
+                    return;
+                }
+                let html = `<i class="bi bi-eye me-1"></i>${stats.view_count} view${stats.view_count !== 1 ? 's' : ''}`;
+                if (stats.copy_count > 0) {
+                    html += ` | <i class="bi bi-clipboard me-1"></i>${stats.copy_count} cop${stats.copy_count !== 1 ? 'ies' : 'y'}`;
+                }
+                contentStats.querySelector('small').innerHTML = html;
+                contentStats.classList.remove('d-none');
+            })
+            .catch(err => {
+                console.error('Failed to load content stats:', err);
+            });
+    }
+
     // Auto-focus on the concept textarea when page loads
     const conceptTextarea = document.getElementById('concept');
     if (conceptTextarea) {
@@ -0,0 +1,28 @@
+import os
+import tempfile
+
+import pytest
+
+# main.py reads DATABASE_URL at import time, so point it at a throwaway database first
+_db_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
+
+import main  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    """Flask test client with a clean render cache"""
+    main.app.config["TESTING"] = True
+    main._rendered_content_cache.clear()
+    return main.app.test_client()
+
+
+@pytest.fixture
+def content_id(client):
+    """ID of a freshly generated and saved piece of content"""
+    from models import GeneratedContent
+
+    client.post('/generate', data={'concept': 'misty forest cabin at dawn'})
+    with main.app.app_context():
+        return GeneratedContent.query.order_by(GeneratedContent.id.desc()).first().id
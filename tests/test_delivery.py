@@ -0,0 +1,176 @@
+import gzip
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+import main
+
+
+def test_view_content_returns_304_for_matching_etag(client, content_id):
+    response = client.get(f'/view/{content_id}')
+    etag = response.headers['ETag']
+    assert response.status_code == 200
+    assert 'no-cache' in response.headers['Cache-Control']
+
+    response = client.get(f'/view/{content_id}', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.headers['ETag'] == etag
+
+
+def test_view_content_without_accept_encoding_is_uncompressed(client, content_id):
+    response = client.get(f'/view/{content_id}', headers={'Accept-Encoding': 'identity'})
+    assert response.status_code == 200
+    assert 'Content-Encoding' not in response.headers
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert b'Original Concept' in response.data
+
+
+def test_view_content_gzip_and_304_share_etag_and_vary(client, content_id):
+    headers = {'Accept-Encoding': 'gzip'}
+    response = client.get(f'/view/{content_id}', headers=headers)
+    assert response.status_code == 200
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert response.headers['ETag'].startswith('W/')
+    assert b'Original Concept' in gzip.decompress(response.data)
+
+    etag = response.headers['ETag']
+    response = client.get(f'/view/{content_id}', headers={**headers, 'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.headers['ETag'] == etag
+    assert 'Accept-Encoding' in response.headers['Vary']
+
+
+def test_view_content_brotli(client, content_id):
+    brotli = pytest.importorskip('brotli')
+    response = client.get(f'/view/{content_id}', headers={'Accept-Encoding': 'br, gzip'})
+    assert response.headers['Content-Encoding'] == 'br'
+    assert b'Original Concept' in brotli.decompress(response.data)
+
+
+def test_view_content_copy_buttons_reference_fields(client, content_id):
+    html = client.get(f'/view/{content_id}').data.decode()
+    for target in re.findall(r'data-copy-target="#([\w-]+)"', html):
+        assert f'id="{target}"' in html
+    assert 'data-copy-target="#etsy-description"' in html
+    assert 'data-copy-target="#pinterest-caption"' in html
+
+
+def test_view_content_rerenders_when_static_fingerprint_changes(client, content_id, monkeypatch):
+    html = client.get(f'/view/{content_id}').data.decode()
+    assert f"script.js?v={main.static_fingerprint('script.js')}" in html
+
+    monkeypatch.setattr(main, 'static_fingerprint', lambda filename: 'changed')
+    html = client.get(f'/view/{content_id}').data.decode()
+    assert 'script.js?v=changed' in html
+
+
+def test_content_stats(client, content_id):
+    client.get(f'/view/{content_id}')
+    response = client.get(f'/api/content/{content_id}/stats')
+    assert response.status_code == 200
+    assert response.headers['Cache-Control'] == 'no-store'
+    assert response.get_json()['view_count'] >= 1
+    assert 'copy_count' in response.get_json()
+
+
+def test_content_stats_unknown_content(client):
+    response = client.get('/api/content/999999/stats')
+    assert response.status_code == 404
+
+
+def test_fingerprinted_static_asset_is_immutable(client):
+    fingerprint = main.static_fingerprint('script.js')
+    response = client.get(f'/static/script.js?v={fingerprint}')
+    cache_control = response.headers['Cache-Control']
+    assert response.status_code == 200
+    assert 'immutable' in cache_control
+    assert f'max-age={main.STATIC_ASSET_MAX_AGE}' in cache_control
+    assert 'no-cache' not in cache_control
+
+
+def test_static_asset_with_stale_fingerprint_is_not_immutable(client):
+    response = client.get('/static/script.js?v=stale')
+    assert 'immutable' not in response.headers.get('Cache-Control', '')
+    assert 'no-cache' in response.headers['Cache-Control']
+
+
+def test_compressed_static_asset_does_not_advertise_ranges(client):
+    response = client.get('/static/script.js', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Ranges' not in response.headers
+    assert response.headers['ETag'].startswith('W/')
+
+
+def test_static_fingerprint_rejects_paths_outside_static_folder():
+    assert main.static_fingerprint('../main.py') is None
+    assert main.static_fingerprint('../../../../etc/hostname') is None
+    assert main.static_fingerprint('') is None
+
+
+def test_static_path_traversal_does_not_read_file(client, monkeypatch):
+    opened = []
+    real_open = open
+    monkeypatch.setattr('builtins.open',
+                        lambda path, *args, **kwargs: opened.append(path) or real_open(path, *args, **kwargs))
+
+    response = client.get('/static/script.js', query_string={'v': 'abc'},
+                          environ_overrides={'PATH_INFO': '/static/../../../../etc/hostname'})
+    assert response.status_code == 404
+    assert not any('hostname' in str(path) for path in opened)
+    assert not any('..' in filename for filename in main._static_fingerprints)
+
+
+def test_cached_page_records_only_linked_assets(client, content_id):
+    main.static_fingerprint('unlinked-asset.css')  # Missing files are never recorded
+    client.get(f'/view/{content_id}')
+    page = main._rendered_content_cache[content_id]
+    assert set(page['static_fingerprints']) == {'script.js'}
+
+
+def test_compressed_static_asset_is_compressed_once(client, monkeypatch):
+    main._compressed_static_cache.clear()
+    calls = []
+    real_compress = main.compress_body
+    monkeypatch.setattr(main, 'compress_body',
+                        lambda data, encoding: calls.append(encoding) or real_compress(data, encoding))
+
+    url = f"/static/script.js?v={main.static_fingerprint('script.js')}"
+    first = client.get(url, headers={'Accept-Encoding': 'gzip'})
+    second = client.get(url, headers={'Accept-Encoding': 'gzip'})
+    assert calls == ['gzip']
+    assert first.data == second.data
+    assert second.headers['Content-Encoding'] == 'gzip'
+
+
+def test_rendered_content_cache_is_safe_under_concurrent_eviction(monkeypatch):
+    monkeypatch.setattr(main, 'RENDER_CACHE_MAX_ENTRIES', 2)
+    main._rendered_content_cache.clear()
+    # Switch threads as often as possible to surface races between lookup and eviction
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    contents = [
+        SimpleNamespace(id=1000 + i, concept=f'concept {i}', midjourney_prompts=['prompt'],
+                        etsy_titles=['title'], etsy_tags=['tag'], etsy_description='description',
+                        pinterest_caption='caption', created_at=datetime(2025, 7, 28))
+        for i in range(6)
+    ]
+
+    def render_all():
+        with main.app.test_request_context():
+            for _ in range(50):
+                for content in contents:
+                    page = main.get_rendered_content(content)
+                    assert f'concept {content.id - 1000}'.encode() in page['data']
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for future in [executor.submit(render_all) for _ in range(8)]:
+                future.result()
+    finally:
+        sys.setswitchinterval(switch_interval)
+    assert len(main._rendered_content_cache) <= 2